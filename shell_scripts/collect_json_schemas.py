@@ -1,24 +1,56 @@
 #!/usr/bin/env python3
 
 import json
-from pathlib import Path
+import os
 
 from pydantic.json_schema import model_json_schema
+import vault_autopilot
 from vault_autopilot import dto
 from vault_autopilot._conf import Settings
 
 
-def execute(output_dir: str):
-    for filename, builder in {
-        Path(output_dir) / "issuer.json": dto.IssuerApplyDTO,
-        Path(output_dir) / "secrets_engine.json": dto.SecretsEngineApplyDTO,
-        Path(output_dir) / "pki_role.json": dto.PKIRoleApplyDTO,
-        Path(output_dir) / "password.json": dto.PasswordApplyDTO,
-        Path(output_dir) / "password_policy.json": dto.PasswordPolicyApplyDTO,
-        Path(output_dir) / "ssh_key.json": dto.SSHKeyApplyDTO,
-        Path(output_dir) / "configuration.json": Settings,
-    }.items():
-        filename.write_text(json.dumps(model_json_schema(builder), indent=2))
+def _sources_mtime() -> float:
+    """
+    Returns the modification time of the most recently changed source file. A schema
+    may pull in models from anywhere in the package, so all of them are considered.
+    """
+    return max(
+        os.stat(os.path.join(dirpath, fn)).st_mtime
+        for src_dir in vault_autopilot.__path__
+        for dirpath, _, filenames in os.walk(src_dir)
+        for fn in filenames
+        if fn.endswith(".py")
+    )
+
+
+def _is_up_to_date(filename: str, mtime: float) -> bool:
+    try:
+        return os.stat(filename).st_mtime >= mtime
+    except OSError:
+        return False
+
+
+def execute(output_dir: str, force: bool = False):
+    builders = {
+        os.path.join(output_dir, "issuer.json"): dto.IssuerApplyDTO,
+        os.path.join(output_dir, "secrets_engine.json"): dto.SecretsEngineApplyDTO,
+        os.path.join(output_dir, "pki_role.json"): dto.PKIRoleApplyDTO,
+        os.path.join(output_dir, "password.json"): dto.PasswordApplyDTO,
+        os.path.join(output_dir, "password_policy.json"): dto.PasswordPolicyApplyDTO,
+        os.path.join(output_dir, "ssh_key.json"): dto.SSHKeyApplyDTO,
+        os.path.join(output_dir, "configuration.json"): Settings,
+    }
+
+    if not force:
+        mtime = _sources_mtime()
+
+        for filename in [fn for fn in builders if _is_up_to_date(fn, mtime)]:
+            print("up-to-date", filename)
+            del builders[filename]
+
+    for filename, builder in builders.items():
+        with open(filename, "w") as buf:
+            json.dump(model_json_schema(builder), buf, indent=2)
         print("generated", filename)
 
 
@@ -30,6 +62,12 @@ if __name__ == "__main__":
         description="Collects JSON schemas from entire application to a given folder.",
     )
     parser.add_argument("output_dir")
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="Regenerate the schemas even if they are newer than the sources.",
+    )
     args = parser.parse_args()
 
-    execute(output_dir=args.output_dir)
+    execute(output_dir=args.output_dir, force=args.force)
@@ -1,32 +1,43 @@
 #!/usr/bin/env python3
 
+import functools
 import logging
 import pathlib
+from typing import TYPE_CHECKING, Any
 
 import click
-import lazy_object_proxy
-import pydantic
 
-from vault_autopilot._cli.commands.apply import apply
-from vault_autopilot._cli.exc import ConfigSyntaxError, ConfigValidationError
-from vault_autopilot._conf import Settings
-from vault_autopilot.exc import Location
-from vault_autopilot.util.model import convert_errors
+from vault_autopilot._cli.group import LazyGroup
+
+if TYPE_CHECKING:
+    from vault_autopilot._conf import Settings
 
 ConfigOption = pathlib.Path | None
 
 
-def validate_config(ctx: click.Context, fn: ConfigOption) -> Settings:
-    payload = {}
+def validate_config(ctx: click.Context, fn: ConfigOption) -> "Settings":
+    import pydantic
+
+    from vault_autopilot._cli.exc import ConfigSyntaxError, ConfigValidationError
+    from vault_autopilot._conf import Settings
+    from vault_autopilot.exc import Location
+    from vault_autopilot.util.model import convert_errors
+
+    payload: Any = {}
 
-    if fn is not None:
-        from ruamel import yaml
+    if fn is not None and fn.suffix == ".json":
+        # JSON is a subset of YAML, but pydantic decodes it natively, without
+        # building an intermediate Python object
+        payload = fn.read_bytes()
+    elif fn is not None:
         from ruamel.yaml.error import YAMLError
 
-        _loader = yaml.YAML(typ="safe")
+        # Shares the loader with the manifest parser, so the resolver and
+        # constructor tables are built once per process
+        from vault_autopilot.parser import loader
 
         try:
-            payload = _loader.load(fn.read_bytes())
+            payload = loader.load(fn.read_bytes())
         except YAMLError as ex:
             raise ConfigSyntaxError(
                 str(ex),
@@ -34,19 +45,35 @@ def validate_config(ctx: click.Context, fn: ConfigOption) -> Settings:
             ) from ex
 
     try:
-        res = Settings(**payload)
+        res = (
+            Settings.model_validate_json(payload)
+            if isinstance(payload, bytes)
+            else Settings.model_validate(payload)
+        )
     except pydantic.ValidationError as ex:
+        if fn is not None and (
+            err := next(
+                (err for err in ex.errors() if err["type"] == "json_invalid"), None
+            )
+        ):
+            raise ConfigSyntaxError(
+                err["msg"],
+                ctx=ConfigSyntaxError.Context(loc=Location(filename=fn)),
+            ) from ex
+
         # TODO: prevent token leakage in case of validation error
         raise ConfigValidationError(str(convert_errors(ex))) from ex
 
-    assert isinstance(res, Settings), "Expected %r, got %r" % (
-        Settings.__name__,
-        res,
-    )
     return res
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={"apply": "vault_autopilot._cli.commands.apply:apply"},
+    # Set on the group, rather than when invoking it, so that the console script
+    # reads the options from the environment too
+    context_settings={"auto_envvar_prefix": "VAULT_AUTOPILOT"},
+)
 @click.option("-D", "--debug/--no-debug", default=False, help="Enable debug mode.")
 @click.option(
     "-c",
@@ -57,17 +84,17 @@ def validate_config(ctx: click.Context, fn: ConfigOption) -> Settings:
         readable=True,
         path_type=pathlib.Path,
     ),
-    help="Path to a YAML configuration file.",
+    help="Path to a YAML (or JSON) configuration file.",
 )
 @click.pass_context
 def cli(ctx: click.Context, debug: bool, config: ConfigOption) -> None:
     logging.basicConfig(
         level=logging.DEBUG if debug else logging.WARNING,
     )
-    ctx.obj = lazy_object_proxy.Proxy(lambda: validate_config(ctx=ctx, fn=config))
-
+    # The configuration is validated on first access, commands that don't need it
+    # don't pay for it
+    ctx.obj = functools.partial(validate_config, ctx=ctx, fn=config)
 
-cli.add_command(apply)
 
 if __name__ == "__main__":
-    cli(auto_envvar_prefix="VAULT_AUTOPILOT")
+    cli()
@@ -1,12 +1,11 @@
 import asyncio
-import glob
-import pathlib
+import os
 import signal
 from contextlib import suppress
 from dataclasses import dataclass, field
 from enum import StrEnum
 from logging import getLogger
-from typing import IO, Any, Iterator, NoReturn, Sequence, Union
+from typing import IO, Any, Callable, Iterator, NoReturn, Sequence, Union
 
 import click
 from ironfence import Mutex
@@ -25,7 +24,7 @@ from vault_autopilot.repo.snapshot import SnapshotRepo
 from vault_autopilot.storage import KvV2SecretStorage
 from vault_autopilot.util.dependency_chain import DependencyChain
 
-from ... import _conf, exc
+from ... import _conf, exc, util
 from ..._pkg import asyva
 from ...dispatcher import Dispatcher, event
 from ...service import (
@@ -47,6 +46,13 @@ __all__ = ["apply"]
 
 logger = getLogger(__name__)
 
+SETTINGS_META_KEY = "vault_autopilot.settings"
+
+MANIFEST_QUEUE_MAXSIZE = 64
+"""The maximum number of parsed manifests waiting to be dispatched. Once reached, the
+parser is suspended until the dispatcher catches up, which keeps memory usage bounded
+regardless of the number of manifests."""
+
 
 @dataclass(slots=True)
 class Record:
@@ -59,26 +65,132 @@ class RecordStyle(StrEnum):
     CRITICAL = "yellow"
 
 
+RecordTemplate = tuple[Callable[[str, str], str], RecordStyle]
+
+RECORD_TEMPLATES: dict[str, RecordTemplate] = {
+    "application_requested": (
+        lambda kind, path: f"Applying {kind} {path!r}...",
+        RecordStyle.INFO,
+    ),
+    "verify_success": (
+        lambda kind, path: f"Verifying integrity of {kind} {path!r}... done",
+        RecordStyle.INFO,
+    ),
+    "verify_error": (
+        lambda kind, path: f"Verifying integrity of {kind} {path!r}... FAILED",
+        RecordStyle.CRITICAL,
+    ),
+    "update_success": (
+        lambda kind, path: f"Updating {kind} {path!r}... done",
+        RecordStyle.INFO,
+    ),
+    "update_error": (
+        lambda kind, path: f"Updating {kind} {path!r}... FAILED",
+        RecordStyle.CRITICAL,
+    ),
+    "create_success": (
+        lambda kind, path: f"Creating {kind} {path!r}... done",
+        RecordStyle.INFO,
+    ),
+    "create_error": (
+        lambda kind, path: f"Creating {kind} {path!r}... FAILED",
+        RecordStyle.CRITICAL,
+    ),
+}
+"""Record templates, keyed by the resource lifecycle stage. The content is rendered
+by an f-string, rather than parsing a format string on every event."""
+
+
+def resolve_record_template(ev_type: type[event.EventType]) -> RecordTemplate:
+    if issubclass(ev_type, event.ResourceApplicationRequested):
+        return RECORD_TEMPLATES["application_requested"]
+    elif issubclass(ev_type, event.ResourceVerifySuccess):
+        return RECORD_TEMPLATES["verify_success"]
+    elif issubclass(ev_type, event.ResourceVerifyError):
+        return RECORD_TEMPLATES["verify_error"]
+    elif issubclass(ev_type, event.ResourceUpdateSuccess):
+        return RECORD_TEMPLATES["update_success"]
+    elif issubclass(ev_type, event.ResourceUpdateError):
+        return RECORD_TEMPLATES["update_error"]
+    elif issubclass(ev_type, event.ResourceCreateSuccess):
+        return RECORD_TEMPLATES["create_success"]
+    elif issubclass(ev_type, event.ResourceCreateError):
+        return RECORD_TEMPLATES["create_error"]
+
+    raise RuntimeError("Unexpected event type: %r" % ev_type)
+
+
+RESOURCE_EVENTS = (
+    event.PasswordApplicationRequested,
+    event.PasswordUpdateError,
+    event.PasswordCreateError,
+    event.PasswordVerifyError,
+    event.PasswordCreateSuccess,
+    event.PasswordUpdateSuccess,
+    event.PasswordVerifySuccess,
+    event.IssuerApplicationRequested,
+    event.IssuerCreateError,
+    event.IssuerUpdateError,
+    event.IssuerVerifyError,
+    event.IssuerCreateSuccess,
+    event.IssuerUpdateSuccess,
+    event.IssuerVerifySuccess,
+    event.PasswordPolicyApplicationRequested,
+    event.PasswordPolicyVerifyError,
+    event.PasswordPolicyUpdateError,
+    event.PasswordPolicyCreateError,
+    event.PasswordPolicyCreateSuccess,
+    event.PasswordPolicyUpdateSuccess,
+    event.PasswordPolicyVerifySuccess,
+    event.PKIRoleApplicationRequested,
+    event.PKIRoleUpdateError,
+    event.PKIRoleCreateError,
+    event.PKIRoleVerifyError,
+    event.PKIRoleCreateSuccess,
+    event.PKIRoleUpdateSuccess,
+    event.PKIRoleVerifySuccess,
+    event.SecretsEngineApplicationRequested,
+    event.SecretsEngineUpdateError,
+    event.SecretsEngineCreateError,
+    event.SecretsEngineVerifyError,
+    event.SecretsEngineCreateSuccess,
+    event.SecretsEngineUpdateSuccess,
+    event.SecretsEngineVerifySuccess,
+    event.SSHKeyApplicationRequested,
+    event.SSHKeyCreateError,
+    event.SSHKeyUpdateError,
+    event.SSHKeyVerifyError,
+    event.SSHKeyCreateSuccess,
+    event.SSHKeyUpdateSuccess,
+    event.SSHKeyVerifySuccess,
+)
+"""Resource events reported on the display."""
+
+EVENT_RECORD_TEMPLATES: dict[type[event.EventType], RecordTemplate] = {
+    ev_type: resolve_record_template(ev_type) for ev_type in RESOURCE_EVENTS
+}
+"""Record templates, keyed by the exact type of the event. The template of each event
+type is resolved once, rather than walking the class hierarchy on every event."""
+
+
 @dataclass(slots=True)
 class RecordRenderer(AbstractRenderer):
-    _records: dict[int, Record] = field(default_factory=dict)
+    _rendered: dict[str, RenderableType] = field(default_factory=dict)
 
     def create_or_update_record(
-        self, record_uid: int, content: str, style: str = ""
+        self, record_uid: str, content: str, style: str = ""
     ) -> Record:
         record = Record(content=content, style=style)
 
-        self._records.update({record_uid: record})
+        # A record is updated a few times at most, while the display is refreshed
+        # every tenth of a second, so the record content is composed once per update
+        self._rendered.update({record_uid: self._compose_record_content(record)})
+        self.changed.set()
 
         return record
 
     def compose_renderable(self) -> RenderableType:
-        return Group(
-            *(
-                self._compose_record_content(record)
-                for record in self._records.values()
-            ),
-        )
+        return Group(*self._rendered.values())
 
     def _compose_record_content(self, record: Record) -> RenderableType:
         return Text(f"=> {record.content}", style=record.style)
@@ -95,6 +207,20 @@ class ManifestObject(AbstractManifestObject):
     ) = Field(discriminator="kind")
 
 
+APPLICATION_REQUESTED_EVENTS: dict[
+    str, Callable[[Any], event.ResourceApplicationRequested]
+] = {
+    "Password": event.PasswordApplicationRequested,
+    "Issuer": event.IssuerApplicationRequested,
+    "PasswordPolicy": event.PasswordPolicyApplicationRequested,
+    "PKIRole": event.PKIRoleApplicationRequested,
+    "SecretsEngine": event.SecretsEngineApplicationRequested,
+    "SSHKey": event.SSHKeyApplicationRequested,
+}
+"""Maps the manifest kinds to the events requesting their application. The payload
+type is already guaranteed by the discriminator of :class:`ManifestObject`."""
+
+
 @dataclass(slots=True)
 class ApplyManifestsStage(AbstractStage):
     title: str = "Applying manifests"
@@ -109,16 +235,36 @@ class AppContext:
     workflow: Workflow
 
 
-def handle_exception(ex: Exception, ctx: AppContext) -> NoReturn:
-    asyncio.get_event_loop().run_until_complete(
-        graceful_shutdown(ctx.workflow, ctx.client, "failed")
-    )
+INTEGRITY_ERRORS = (
+    # TODO: Instead of just saying "Policy not found", provide the user with
+    #  a more informative error message that includes the line number in the
+    #  manifest file where the policy path was defined.
+    asyva.exc.PasswordPolicyNotFoundError,
+    asyva.exc.SecretsEnginePathInUseError,
+    exc.ResourceIntegrityError,
+)
+REPORTABLE_ERRORS = (
+    asyva.exc.UnauthorizedError,
+    (exc.ManifestError, ConnectionRefusedError),
+    INTEGRITY_ERRORS,
+    CLIError,
+)
+"""Errors with a meaningful message for the user, in the order of precedence in which
+they are reported when several tasks fail at once."""
+
 
-    while True:
-        if isinstance(ex, ExceptionGroup):
+def handle_exception(ex: Exception) -> NoReturn:
+    if isinstance(ex, ExceptionGroup):
+        # The sibling errors aren't shown to the user, keep them for debugging
+        logger.debug("%d task(s) failed", len(ex.exceptions), exc_info=ex)
+
+        # Several tasks may have failed at once, report the most relevant error
+        ex = next(
+            (grp for grp in map(ex.subgroup, REPORTABLE_ERRORS) if grp is not None), ex
+        )
+
+        while isinstance(ex, ExceptionGroup):
             ex = ex.exceptions[0]
-            continue
-        break
 
     if isinstance(ex, asyva.exc.UnauthorizedError):
         raise CLIError("Authorization failed: %s" % ex) from ex
@@ -126,17 +272,7 @@ def handle_exception(ex: Exception, ctx: AppContext) -> NoReturn:
     if isinstance(ex, (exc.ManifestError, ConnectionRefusedError)):
         raise CLIError(str(ex)) from ex
 
-    if isinstance(
-        ex,
-        (
-            # TODO: Instead of just saying "Policy not found", provide the user with
-            #  a more informative error message that includes the line number in the
-            #  manifest file where the policy path was defined.
-            asyva.exc.PasswordPolicyNotFoundError,
-            asyva.exc.SecretsEnginePathInUseError,
-            exc.ResourceIntegrityError,
-        ),
-    ):
+    if isinstance(ex, INTEGRITY_ERRORS):
         # TODO: print the contents of a YAML file, highlighting any invalid
         #  lines.
         raise CLIError(str(ex), exit_code=128) from ex
@@ -153,22 +289,27 @@ async def async_apply(
     patterns: Sequence[str],
     recursive: bool,
     stage: ApplyManifestsStage,
+    queue_size: int = MANIFEST_QUEUE_MAXSIZE,
+    use_cache: bool = False,
 ) -> None:
     client = ctx.client
-    queue = asyncio.Queue[ManifestObject | None]()
+    queue = asyncio.Queue[ManifestObject | None](maxsize=queue_size)
     unresolved_deps: list[exc.UnresolvedDependencyError] = []
 
-    async def configure_dispatcher() -> (
+    def configure_dispatcher() -> (
         Dispatcher[ManifestObject | None, event.EventType]
     ):
         observer, sem = event.EventObserver[event.EventType](), BoundlessSemaphore()
 
-        def proc_kwargs() -> dict[str, Any]:
-            return {
-                "sem": sem,
-                "client": client,
-                "observer": observer,
-            }
+        # The processors share a single dependency chain, the nodes of different
+        # resource kinds never collide, as their hashes are prefixed with the kind
+        dep_chain = Mutex(DependencyChain())
+
+        base_kwargs: dict[str, Any] = {
+            "sem": sem,
+            "client": client,
+            "observer": observer,
+        }
 
         def event_builder(
             payload: ManifestObject | None,
@@ -176,29 +317,12 @@ async def async_apply(
             if payload is None:
                 return event.ShutdownRequested()
 
-            root = payload.root
-            match root.kind:
-                case "Password":
-                    assert isinstance(root, dto.PasswordApplyDTO)
-                    return event.PasswordApplicationRequested(root)
-                case "Issuer":
-                    assert isinstance(root, dto.IssuerApplyDTO)
-                    return event.IssuerApplicationRequested(root)
-                case "PasswordPolicy":
-                    assert isinstance(root, dto.PasswordPolicyApplyDTO)
-                    return event.PasswordPolicyApplicationRequested(root)
-                case "PKIRole":
-                    assert isinstance(root, dto.PKIRoleApplyDTO)
-                    return event.PKIRoleApplicationRequested(root)
-                case "SecretsEngine":
-                    assert isinstance(root, dto.SecretsEngineApplyDTO)
-                    return event.SecretsEngineApplicationRequested(root)
-                case "SSHKey":
-                    assert isinstance(root, dto.SSHKeyApplyDTO)
-                    return event.SSHKeyApplicationRequested(root)
-
-                case _:
-                    raise TypeError("Unexpected payload type: %r" % payload)
+            try:
+                builder = APPLICATION_REQUESTED_EVENTS[payload.root.kind]
+            except KeyError:
+                raise TypeError("Unexpected payload type: %r" % payload) from None
+
+            return builder(payload.root)
 
         dispatcher = Dispatcher[ManifestObject | None, event.EventType](
             client=client,
@@ -207,28 +331,26 @@ async def async_apply(
             processing_registry={
                 "Password": PasswordApplyProcessor(
                     pwd_svc=PasswordService(client),
-                    # TODO: Allow processors to share the same dependency chain to
-                    #  reduce memory consumption.
-                    dep_chain=Mutex(DependencyChain()),
+                    dep_chain=dep_chain,
                     shutdown_event=event.ShutdownRequested,
-                    **proc_kwargs(),
+                    **base_kwargs,
                 ),
                 "Issuer": IssuerApplyProcessor(
                     iss_svc=IssuerService(
                         client, SnapshotRepo("issuer_", ctx.storage, IssuerSnapshot)
                     ),
-                    dep_chain=Mutex(DependencyChain()),
+                    dep_chain=dep_chain,
                     shutdown_event=event.ShutdownRequested,
-                    **proc_kwargs(),
+                    **base_kwargs,
                 ),
                 "PasswordPolicy": PasswordPolicyApplyProcessor(
-                    pwd_policy_svc=PasswordPolicyService(client), **proc_kwargs()
+                    pwd_policy_svc=PasswordPolicyService(client), **base_kwargs
                 ),
                 "PKIRole": PKIRoleApplyProcessor(
                     pki_role_svc=PKIRoleService(client),
-                    dep_chain=Mutex(DependencyChain()),
+                    dep_chain=dep_chain,
                     shutdown_event=event.ShutdownRequested,
-                    **proc_kwargs(),
+                    **base_kwargs,
                 ),
                 "SecretsEngine": SecretsEngineApplyProcessor(
                     secrets_engine_svc=SecretsEngineService(
@@ -237,165 +359,65 @@ async def async_apply(
                             "secrets_engine_", ctx.storage, SecretsEngineSnapshot
                         ),
                     ),
-                    **proc_kwargs(),
+                    **base_kwargs,
                 ),
                 "SSHKey": SSHKeyApplyProcessor(
                     ssh_key_svc=SSHKeyService(client),
-                    dep_chain=Mutex(DependencyChain()),
+                    dep_chain=dep_chain,
                     shutdown_event=event.ShutdownRequested,
-                    **proc_kwargs(),
+                    **base_kwargs,
                 ),
             },
             queue=queue,
         )
 
-        TEMPLATE_DICT = {
-            "application_requested": (
-                "Applying {resource_kind} {absolute_path!r}...",
-                RecordStyle.INFO,
-            ),
-            "verify_success": (
-                "Verifying integrity of {resource_kind} {absolute_path!r}... done",
-                RecordStyle.INFO,
-            ),
-            "verify_error": (
-                "Verifying integrity of {resource_kind} {absolute_path!r}... FAILED",
-                RecordStyle.CRITICAL,
-            ),
-            "update_success": (
-                "Updating {resource_kind} {absolute_path!r}... done",
-                RecordStyle.INFO,
-            ),
-            "update_error": (
-                "Updating {resource_kind} {absolute_path!r}... FAILED",
-                RecordStyle.CRITICAL,
-            ),
-            "create_success": (
-                "Creating {resource_kind} {absolute_path!r}... done",
-                RecordStyle.INFO,
-            ),
-            "create_error": (
-                "Creating {resource_kind} {absolute_path!r}... FAILED",
-                RecordStyle.CRITICAL,
-            ),
-        }
-
         async def on_resource_update(
             ev: Union[
                 event.ResourceApplicationRequested,
-                event.ResourceApplicationInitiated,
                 event.ResourceApplySuccess,
                 event.ResourceApplyError,
             ],
         ) -> None:
-            if isinstance(ev, event.ResourceApplicationRequested):
-                template = TEMPLATE_DICT["application_requested"]
-            elif isinstance(ev, event.ResourceApplicationInitiated):
-                return
-            elif isinstance(ev, event.ResourceVerifySuccess):
-                template = TEMPLATE_DICT["verify_success"]
-            elif isinstance(ev, event.ResourceVerifyError):
-                template = TEMPLATE_DICT["verify_error"]
-            elif isinstance(ev, event.ResourceUpdateSuccess):
-                template = TEMPLATE_DICT["update_success"]
-            elif isinstance(ev, event.ResourceUpdateError):
-                template = TEMPLATE_DICT["update_error"]
-            elif isinstance(ev, event.ResourceCreateSuccess):
-                template = TEMPLATE_DICT["create_success"]
-            elif isinstance(ev, event.ResourceCreateError):
-                template = TEMPLATE_DICT["create_error"]
-            else:
-                raise RuntimeError("Unexpected event type: %r" % ev)
-
+            template = EVENT_RECORD_TEMPLATES[type(ev)]
             path = ev.resource.absolute_path()
             stage.renderer.create_or_update_record(
-                record_uid=hash(ev.resource.__class__.__name__ + path),
-                content=template[0].format(
-                    resource_kind=ev.resource.kind,
-                    absolute_path=path,
-                ),
+                # Resources of different kinds may share the same path
+                record_uid=f"{ev.resource.kind}:{path}",
+                content=template[0](ev.resource.kind, path),
                 style=template[1],
             )
 
         async def on_unresolved_deps_detected(ev: event.UnresolvedDepsDetected) -> None:
             unresolved_deps.extend([*ev.unresolved_deps])
 
-        dispatcher.register_handler(
-            (
-                event.PasswordApplicationRequested,
-                event.PasswordApplicationInitiated,
-                event.PasswordUpdateError,
-                event.PasswordCreateError,
-                event.PasswordVerifyError,
-                event.PasswordCreateSuccess,
-                event.PasswordUpdateSuccess,
-                event.PasswordVerifySuccess,
-                event.IssuerApplicationRequested,
-                event.IssuerApplicationInitiated,
-                event.IssuerCreateError,
-                event.IssuerUpdateError,
-                event.IssuerVerifyError,
-                event.IssuerCreateSuccess,
-                event.IssuerUpdateSuccess,
-                event.IssuerVerifySuccess,
-                event.PasswordPolicyApplicationRequested,
-                event.PasswordPolicyApplicationInitiated,
-                event.PasswordPolicyVerifyError,
-                event.PasswordPolicyUpdateError,
-                event.PasswordPolicyCreateError,
-                event.PasswordPolicyCreateSuccess,
-                event.PasswordPolicyUpdateSuccess,
-                event.PasswordPolicyVerifySuccess,
-                event.PKIRoleApplicationRequested,
-                event.PKIRoleApplicationInitiated,
-                event.PKIRoleUpdateError,
-                event.PKIRoleCreateError,
-                event.PKIRoleVerifyError,
-                event.PKIRoleCreateSuccess,
-                event.PKIRoleUpdateSuccess,
-                event.PKIRoleVerifySuccess,
-                event.SecretsEngineApplicationRequested,
-                event.SecretsEngineApplicationInitiated,
-                event.SecretsEngineUpdateError,
-                event.SecretsEngineCreateError,
-                event.SecretsEngineVerifyError,
-                event.SecretsEngineCreateSuccess,
-                event.SecretsEngineUpdateSuccess,
-                event.SecretsEngineVerifySuccess,
-                event.SSHKeyApplicationRequested,
-                event.SSHKeyApplicationInitiated,
-                event.SSHKeyCreateError,
-                event.SSHKeyUpdateError,
-                event.SSHKeyVerifyError,
-                event.SSHKeyCreateSuccess,
-                event.SSHKeyUpdateSuccess,
-                event.SSHKeyVerifySuccess,
-            ),
-            callback=on_resource_update,
-        )
+        dispatcher.register_handler(RESOURCE_EVENTS, callback=on_resource_update)
         dispatcher.register_handler(
             (event.UnresolvedDepsDetected,), callback=on_unresolved_deps_detected
         )
 
         return dispatcher
 
-    def stream_data_from_files() -> Iterator[IO[bytes]]:
+    def stream_data_from_files() -> Iterator[IO[bytes] | util.fs.MappedFile]:
         """Yields an iterator of binary file objects for regular files matching given
         patterns (simple filenames or globs). Skips dirs if ``recursive`` is ``False``;
-        otherwise, includes all matching files in the dir."""
-        for pat in patterns:
+        otherwise, includes all matching files in the dir. Files matching several
+        patterns are yielded only once."""
+        seen: set[str] = set()
+
+        for pat in dict.fromkeys(patterns):
             counter = 0
 
             for counter, fn in enumerate(
-                (
-                    fn
-                    for fn in glob.iglob(pat, recursive=recursive)
-                    if not pathlib.Path(fn).is_dir()
-                ),
-                1,
+                util.fs.iglob_files(pat, recursive=recursive), 1
             ):
+                if (real_fn := os.path.realpath(fn)) in seen:
+                    logger.debug("skipping manifest %r, already streamed", fn)
+                    continue
+
+                seen.add(real_fn)
+
                 logger.debug("streaming manifest %r", fn)
-                yield open(fn, "rb")
+                yield util.fs.open_binary(fn)
 
             if counter == 0:
                 raise CLIError(
@@ -410,16 +432,30 @@ async def async_apply(
         """Yields an iterator of binary data from standard input."""
         yield click.get_binary_stream("stdin")
 
-    async def handle_manifests():
+    async def connect() -> None:
         await client.authenticate(
             base_url=ctx.settings.base_url,
             authn=ctx.settings.auth,
             namespace=ctx.settings.default_namespace,
         )
-        await ctx.storage.initialize()
-        await ctx.storage.pull()
 
-        num = await (await configure_dispatcher()).dispatch()
+        # The snapshots are read while the storage is being initialized, a secrets
+        # engine that doesn't exist yet reads as an empty storage. Both are awaited
+        # to completion, as a pull from a mount of the wrong type may fail before
+        # the initialization does, and the latter explains the failure.
+        for result in await asyncio.gather(
+            ctx.storage.initialize(), ctx.storage.pull(), return_exceptions=True
+        ):
+            if isinstance(result, BaseException):
+                raise result
+
+    async def handle_manifests(connected: asyncio.Task[None]) -> None:
+        # The snapshots are read lazily, so the dispatcher is configured while the
+        # connection is being established, and no remote I/O is needed to assemble it
+        dispatcher = configure_dispatcher()
+        await connected
+
+        num = await dispatcher.dispatch()
 
         if num == 0:
             raise CLIError(
@@ -427,13 +463,17 @@ async def async_apply(
                 "data and try again."
             )
 
+    # The tasks start in the order of creation, the connection round-trips are in
+    # flight by the time the dispatcher is configured and the parser starts reading
     async with asyncio.TaskGroup() as tg:
-        tg.create_task(handle_manifests())
+        connected = tg.create_task(connect())
+        tg.create_task(handle_manifests(connected))
         tg.create_task(
             ManifestParser(
                 stream_data_from_files() if patterns else stream_data_from_stdin(),
                 ManifestObject,
                 queue,
+                use_cache=use_cache,
             ).execute()
         )
 
@@ -467,6 +507,36 @@ async def graceful_shutdown(workflow: Workflow, client: asyva.Client, reason: st
             await asyncio.gather(*tasks)
 
 
+def get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Returns a factory for the event loop that runs the command, or ``None`` to use
+    the default one. uvloop is an optional, faster drop-in replacement for the
+    default event loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    return uvloop.new_event_loop
+
+
+def get_settings(ctx: click.Context) -> _conf.Settings:
+    """
+    Returns the application settings, validating the configuration on first access.
+
+    The root command stores a callable that loads the configuration in the context
+    object, the result is memoized in the context metadata.
+    """
+    if (settings := ctx.meta.get(SETTINGS_META_KEY)) is None:
+        if not callable(load_settings := ctx.find_root().obj):
+            raise RuntimeError("Configuration not found")
+
+        settings = ctx.meta[SETTINGS_META_KEY] = load_settings()
+
+    return settings
+
+
 # TODO: epilog https://click.palletsprojects.com/en/8.1.x/documentation/#command-epilog-help
 # TODO: ca-cert, ca-path, client-cert, client-key
 @click.command()
@@ -492,11 +562,45 @@ async def graceful_shutdown(workflow: Workflow, client: asyva.Client, reason: st
         "you want to manage related manifests organized within the same directory."
     ),
 )
+@click.option(
+    "--queue-size",
+    type=click.IntRange(min=0),
+    default=MANIFEST_QUEUE_MAXSIZE,
+    show_default=True,
+    help=(
+        "The maximum number of parsed manifests waiting to be applied. Reading the "
+        "manifests is paused once the limit is reached. Set to 0 for no limit."
+    ),
+)
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=0),
+    default=100,
+    show_default=True,
+    help=(
+        "The maximum number of concurrent requests to the Vault server. Set to 0 for "
+        "no limit."
+    ),
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    show_default=True,
+    help=(
+        "Cache the decoded manifests, so that unchanged files skip the YAML parser on "
+        "subsequent runs. Note that the manifests, including any secret values they "
+        "contain, are then written in plain text to the user cache directory "
+        "($XDG_CACHE_HOME/vault-autopilot). Entries unused for 30 days are evicted."
+    ),
+)
 @click.pass_context
 def apply(
     ctx: click.Context,
     filename: Sequence[str],
     recursive: bool,
+    queue_size: int,
+    max_concurrency: int,
+    cache: bool,
 ) -> None:
     """
     Apply a manifest to a Vault server from a file, directory, or standard input.
@@ -513,13 +617,10 @@ def apply(
       # Apply a manifest from standard input
       $ cat manifest.yaml | vault-autopilot apply
     """
-    ev_loop = asyncio.get_event_loop()
-
-    if not (settings := ctx.find_object(_conf.Settings)):
-        raise RuntimeError("Configuration not found")
+    settings = get_settings(ctx)
 
     client, workflow = (
-        asyva.Client(),
+        asyva.Client(conn_limit=max_concurrency),
         Workflow([ApplyManifestsStage()]),
     )
     app_ctx = AppContext(
@@ -532,40 +633,59 @@ def apply(
         ),
         workflow,
     )
+    stages = workflow.run()
 
-    for sig in (
-        signal.SIGHUP,
-        signal.SIGTERM,
-        signal.SIGINT,
-        signal.SIGTSTP,
-        signal.SIG_IGN,
-    ):
-        ev_loop.add_signal_handler(
-            sig,
-            lambda: asyncio.create_task(graceful_shutdown(workflow, client, "aborted")),
-        )
+    async def run_stages() -> None:
+        stage = await anext(stages)
+        assert isinstance(stage, ApplyManifestsStage), stage
 
-    try:
-        stages = workflow.run()
+        await async_apply(app_ctx, filename, recursive, stage, queue_size, cache)
 
-        stage = ev_loop.run_until_complete(stages.__anext__())
-        assert isinstance(stage, ApplyManifestsStage), stage
+    async def close_client() -> None:
+        await client.__aexit__(None, None, None)
+
+        # Zero-sleep to allow underlying connections to close
+        # https://docs.aiohttp.org/en/stable/client_advanced.html?highlight=sleep#graceful-shutdown
+        await asyncio.sleep(0)
+
+    def fail(ex: Exception) -> NoReturn:
+        runner.run(graceful_shutdown(workflow, client, "failed"))
+        handle_exception(ex)
+
+    # The runner owns the event loop: on exit, it cancels the pending tasks,
+    # finalizes the async generators and shuts down the default executor before
+    # closing the loop.
+    with asyncio.Runner(loop_factory=get_loop_factory()) as runner:
+        ev_loop = runner.get_loop()
+
+        # Coroutines that finish without suspending, such as the event handlers that
+        # only update the display, run to completion as soon as their task is created,
+        # skipping a round-trip through the event loop (Python 3.12+)
+        if (task_factory := getattr(asyncio, "eager_task_factory", None)) is not None:
+            ev_loop.set_task_factory(task_factory)
+
+        def on_signal() -> None:
+            asyncio.create_task(graceful_shutdown(workflow, client, "aborted"))
+
+        # The handlers are removed along with the loop, once the runner is closed
+        for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT, signal.SIGTSTP):
+            ev_loop.add_signal_handler(sig, on_signal)
 
-        ev_loop.run_until_complete(async_apply(app_ctx, filename, recursive, stage))
-    except asyncio.CancelledError:
-        raise click.Abort()
-    except Exception as ex:
-        handle_exception(ex, app_ctx)
-    finally:
         try:
-            ev_loop.run_until_complete(app_ctx.storage.push())
+            runner.run(run_stages())
+        except asyncio.CancelledError:
+            raise click.Abort()
         except Exception as ex:
-            handle_exception(ex, app_ctx)
-
-        ev_loop.run_until_complete(graceful_shutdown(workflow, client, "finished"))
+            fail(ex)
+        finally:
+            try:
+                try:
+                    runner.run(app_ctx.storage.push())
+                except Exception as ex:
+                    fail(ex)
+
+                runner.run(graceful_shutdown(workflow, client, "finished"))
+            finally:
+                runner.run(close_client())
 
     click.secho("\nThanks for choosing Vault Autopilot!", fg="yellow")
-
-    # Zero-sleep to allow underlying connections to close
-    # https://docs.aiohttp.org/en/stable/client_advanced.html?highlight=sleep#graceful-shutdown
-    ev_loop.run_until_complete(asyncio.sleep(0))
@@ -0,0 +1,51 @@
+import importlib
+from typing import Any
+
+import click
+from typing_extensions import override
+
+__all__ = ("LazyGroup",)
+
+
+class LazyGroup(click.Group):
+    """
+    A click group that imports its subcommands only when they are requested.
+
+    Subcommands pull in the whole application (asyncio, aiohttp, pydantic models,
+    etc.), which is wasted work for paths that never run them, such as argument
+    errors on the group itself.
+
+    Args:
+        lazy_subcommands: A mapping of command names to import paths in the
+            ``module:attribute`` format.
+
+    References:
+        https://click.palletsprojects.com/en/8.1.x/complex/#lazily-loading-subcommands
+    """
+
+    def __init__(
+        self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    @override
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted((*super().list_commands(ctx), *self.lazy_subcommands))
+
+    @override
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        module_name, attr_name = self.lazy_subcommands[cmd_name].split(":", 1)
+        cmd = getattr(importlib.import_module(module_name), attr_name)
+
+        if not isinstance(cmd, click.Command):
+            raise ValueError(
+                "Lazy loading of %r failed by returning a non-command object" % cmd_name
+            )
+
+        return cmd
@@ -1,7 +1,9 @@
 from abc import abstractmethod
-from asyncio import Task, get_event_loop, sleep
+from asyncio import Event, Task, get_event_loop, sleep, timeout
+from contextlib import suppress
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import timedelta
+from time import monotonic
 from typing import AsyncGenerator, Optional
 
 from humanize import precisedelta
@@ -13,6 +15,9 @@ from rich.text import Text
 
 @dataclass(slots=True)
 class AbstractRenderer:
+    changed: Event = field(init=False, default_factory=Event)
+    """Set by the renderer whenever its content changes, to request a refresh."""
+
     @abstractmethod
     def compose_renderable(self) -> RenderableType: ...
 
@@ -30,7 +35,7 @@ class AbstractStage:
 class Workflow:
     _stages: list[AbstractStage]
     _index: int = field(init=False, default=-1)
-    _started_at: datetime = field(init=False)
+    _started_at: float = field(init=False)
     _think_task: Task[None] = field(init=False)
     _stop_reason: str = ""
 
@@ -45,19 +50,27 @@ class Workflow:
         return bool(self._stop_reason)
 
     def __del__(self) -> None:
+        # Nothing to stop if the workflow has never started or has already stopped,
+        # the display and the think task may not even exist
+        if self._index == -1 or self.is_stopped:
+            return
+
         self.stop("cancelled")
 
     async def run(self) -> AsyncGenerator[AbstractStage, None]:
-        self._think_task = get_event_loop().create_task(self.think())
-
         for stage in self._stages:
             self._index += 1
-            self._started_at = datetime.now()
+            self._started_at = monotonic()
             self._stop_reason = ""
 
             self._live = Live(self._compose_renderable(stage), auto_refresh=False)
             self._live.start()
 
+            # The display is refreshed once the first stage is live, as the task may
+            # start running as soon as it's created
+            if self._index == 0:
+                self._think_task = get_event_loop().create_task(self.think())
+
             yield stage
 
     async def think(self) -> None:
@@ -65,6 +78,17 @@ class Workflow:
             self.render()
             await sleep(0.1)
 
+            # The display is refreshed on changes, or a few times per second to keep
+            # the elapsed time up-to-date
+            assert self.current_stage is not None
+            changed = self.current_stage.renderer.changed
+
+            with suppress(TimeoutError):
+                async with timeout(0.25):
+                    await changed.wait()
+
+            changed.clear()
+
     def render(self) -> None:
         assert self.current_stage is not None
         assert self._live.is_started is True
@@ -84,7 +108,8 @@ class Workflow:
 
     def _time_elapsed(self) -> str:
         return precisedelta(
-            self._started_at - datetime.now(),
+            # The monotonic clock isn't affected by system clock adjustments
+            timedelta(seconds=monotonic() - self._started_at),
             minimum_unit="seconds",
             suppress=["days"],
             format="%0.4f",
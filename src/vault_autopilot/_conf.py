@@ -1,8 +1,8 @@
+from dataclasses import dataclass
 from typing import Annotated, Literal
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, SecretStr, with_config
 from pydantic.alias_generators import to_camel
-from pydantic.dataclasses import dataclass
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
@@ -12,18 +12,33 @@ from typing_extensions import TypedDict
 
 from ._pkg import asyva
 
+# The auth methods are plain dataclasses, validated as part of the settings, there's
+# no need for pydantic to build a validator for each of them
 _config = ConfigDict(alias_generator=to_camel, extra="forbid")
 
 
-@dataclass(slots=True, config=_config, kw_only=True)
+@with_config(_config)
+@dataclass(slots=True, kw_only=True)
 class KubernetesAuthMethod(asyva.KubernetesAuthenticator):
     method: Literal["kubernetes"]
 
+    def __post_init__(self) -> None:
+        # Only Settings validates the fields, a method built directly may be given a
+        # plain string, which would then leak in the repr
+        if not isinstance(self.jwt, SecretStr):
+            self.jwt = SecretStr(self.jwt)
 
-@dataclass(slots=True, config=_config, kw_only=True)
+
+@with_config(_config)
+@dataclass(slots=True, kw_only=True)
 class TokenAuthMethod(asyva.TokenAuthenticator):
     method: Literal["token"]
 
+    def __post_init__(self) -> None:
+        # See KubernetesAuthMethod.__post_init__
+        if not isinstance(self.token, SecretStr):
+            self.token = SecretStr(self.token)
+
 
 class VaultSecretStorage(TypedDict):
     type: Literal["kvv1-secret"]
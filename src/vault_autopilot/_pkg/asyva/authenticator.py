@@ -1,9 +1,10 @@
 import abc
 import http
 import logging
+import os
 import pathlib
 from dataclasses import dataclass
-from typing import Literal
+from typing import Callable, Literal
 
 import aiohttp
 import pydantic
@@ -17,8 +18,30 @@ __all__ = "AbstractAuthenticator", "KubernetesAuthenticator", "TokenAuthenticato
 logger = logging.getLogger(__name__)
 
 
+_jwt_cache: dict[str, tuple[int, str]] = {}
+
+
 def read_jwt(fn: str) -> str:
-    return pathlib.Path(fn).read_text()
+    """
+    Returns the content of the given file. The content is cached, and the file is
+    read again only once it's modified (e.g. when the token is rotated).
+    """
+    mtime = os.stat(fn).st_mtime_ns
+
+    if (cached := _jwt_cache.get(fn)) is not None and cached[0] == mtime:
+        return cached[1]
+
+    content = pathlib.Path(fn).read_text()
+    _jwt_cache[fn] = (mtime, content)
+
+    return content
+
+
+# The token is either a string or a file containing the string
+_TOKEN_READERS: dict[str, Callable[[pydantic.SecretStr], str]] = {
+    "directvalue": pydantic.SecretStr.get_secret_value,
+    "filebasedvalue": lambda token: read_jwt(token.get_secret_value()),
+}
 
 
 @dataclass(slots=True)
@@ -57,9 +80,11 @@ class KubernetesAuthenticator(AbstractAuthenticator):
         if resp.status == http.HTTPStatus.OK:
             return pydantic.SecretStr(str((await resp.json())["auth"]["client_token"]))
 
-        logger.debug(await resp.json())
-        raise await exc.VaultAPIError.from_response(
-            "Failed to authenticate with kubernetes", resp
+        # The body is decoded once, for both the log and the error context
+        body = await resp.json()
+        logger.debug(body)
+        raise exc.VaultAPIError.from_body(
+            "Failed to authenticate with kubernetes", resp, body
         )
 
 
@@ -74,17 +99,15 @@ class TokenAuthenticator(AbstractAuthenticator):
         References:
             https://developer.hashicorp.com/vault/api-docs/auth/token#lookup-a-token-self
         """
-        # The token is either a string or a file containing the string.
-        match self.source:
-            case "directvalue":
-                token = self.token.get_secret_value()
-            case "filebasedvalue":
-                token = read_jwt(self.token.get_secret_value())
-            case _:
-                raise NotImplementedError(
-                    "Invalid token source specified: %r. Supported sources include "
-                    "'directvalue' and `'filebasedvalue'." % self.source
-                )
+        try:
+            read_token = _TOKEN_READERS[self.source]
+        except KeyError:
+            raise NotImplementedError(
+                "Invalid token source specified: %r. Supported sources include "
+                "'directvalue' and `'filebasedvalue'." % self.source
+            ) from None
+
+        token = read_token(self.token)
 
         resp = await sess.get(
             "/v1/auth/token/lookup-self",
@@ -93,7 +116,8 @@ class TokenAuthenticator(AbstractAuthenticator):
 
         match resp.status:
             case http.HTTPStatus.OK:
-                return self.token
+                # The file-based source holds the path, not the token itself
+                return pydantic.SecretStr(token)
             case http.HTTPStatus.FORBIDDEN:
                 raise exc.UnauthorizedError(
                     "The token you provided is invalid or has expired. Please "
@@ -103,7 +127,9 @@ class TokenAuthenticator(AbstractAuthenticator):
             case _:
                 pass
 
-        logger.debug(await resp.json())
-        raise await exc.VaultAPIError.from_response(
-            "Failed to authenticate with provided token", resp
+        # The body is decoded once, for both the log and the error context
+        body = await resp.json()
+        logger.debug(body)
+        raise exc.VaultAPIError.from_body(
+            "Failed to authenticate with provided token", resp, body
         )
@@ -14,7 +14,7 @@ import aiohttp
 import jinja2
 from typing_extensions import Unpack
 
-from . import authenticator, composer, dto
+from . import authenticator, composer, dto, exc
 from .dto.password_policy import PasswordPolicy
 from .manager import kvv1, kvv2, password_policy, pki, system_backend
 from .util.hcl import deseralize_password_policy
@@ -22,17 +22,47 @@ from .util.hcl import deseralize_password_policy
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# The templates ship with the package and never change at runtime, they're loaded
+# and compiled once, on first use, and shared by all the clients
+_env = jinja2.Environment(
+    loader=jinja2.PackageLoader("vault_autopilot._pkg.asyva"),
+    enable_async=True,
+    auto_reload=False,
+)
 
-def login_required(func: Callable[P, T]) -> Callable[P, T]:
-    @functools.wraps(func)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        assert isinstance((client := args[0]), Client), (
-            "Expected instance of %r, got %r" % (Client, client)
+
+async def _render_password_policy(**kwargs: Any) -> str:
+    return await _env.get_template("password_policy.jinja").render_async(**kwargs)
+
+
+def _build_connection_refused_error(
+    ex: aiohttp.ClientConnectorError,
+) -> ConnectionRefusedError:
+    return ConnectionRefusedError(
+        (
+            'The connection to the server "%s:%s" was refused - did you '
+            "specify the right host or port?"
         )
-        assert (
-            client.is_authenticated
-        ), "The Vault client must be authenticated before calling this method."
-        return func(*args, **kwargs)
+        % (ex.host, ex.port)
+    )
+
+
+def login_required(
+    func: Callable[P, Awaitable[T]],
+) -> Callable[P, Coroutine[Any, Any, T]]:
+    # Also handles the exceptions like `exception_handler` does, so that the methods
+    # requiring a login are wrapped by a single frame
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        # The signature is enforced by the type checker, only the authentication
+        # state is checked at runtime
+        if not args[0]._authn_sess:  # type: ignore[attr-defined]
+            raise exc.NotAuthenticatedError()
+
+        try:
+            return await func(*args, **kwargs)
+        except aiohttp.ClientConnectorError as ex:
+            raise _build_connection_refused_error(ex) from ex
 
     return wrapper
 
@@ -45,13 +75,7 @@ def exception_handler(
         try:
             return await func(*args, **kwargs)
         except aiohttp.ClientConnectorError as ex:
-            raise ConnectionRefusedError(
-                (
-                    'The connection to the server "%s:%s" was refused - did you '
-                    "specify the right host or port?"
-                )
-                % (ex.host, ex.port)
-            ) from ex
+            raise _build_connection_refused_error(ex) from ex
 
     return wrapper
 
@@ -63,12 +87,10 @@ class Client:
     # proxy: Optional[str] = None
     # proxy_auth: Optional[aiohttp.BasicAuth] = None
 
-    _env: jinja2.Environment = field(
-        init=False,
-        default_factory=lambda: jinja2.Environment(
-            loader=jinja2.PackageLoader("vault_autopilot._pkg.asyva"), enable_async=True
-        ),
-    )
+    conn_limit: int = 100
+    """The maximum number of simultaneous connections to the Vault server, requests
+    beyond the limit wait for a free connection. ``0`` means no limit."""
+
     _authn_sess: aiohttp.ClientSession | None = field(init=False, default=None)
     _kvv1_mgr: kvv1.KvV1Manager = field(init=False, default_factory=kvv1.KvV1Manager)
     _kvv2_mgr: kvv2.KvV2Manager = field(init=False, default_factory=kvv2.KvV2Manager)
@@ -79,14 +101,6 @@ class Client:
     _sb_mgr: system_backend.SystemBackendManager = field(
         init=False, default_factory=system_backend.SystemBackendManager
     )
-    _render_password_policy: functools.partial[Coroutine[Any, Any, str]] = field(
-        init=False
-    )
-
-    def __post_init__(self) -> None:
-        self._render_password_policy = functools.partial(
-            self._env.get_template("password_policy.jinja").render_async
-        )
 
     @property
     def is_authenticated(self) -> bool:
@@ -107,7 +121,7 @@ class Client:
         # the secured endpoints
         self._authn_sess = composer.StandardComposer(
             base_url=base_url, token=token, namespace=namespace
-        ).create()
+        ).create(connector=aiohttp.TCPConnector(limit=self.conn_limit))
 
         self._kvv1_mgr.configure(sess=self._authn_sess)
         self._kvv2_mgr.configure(sess=self._authn_sess)
@@ -120,18 +134,16 @@ class Client:
     async def __aenter__(self) -> "Client":
         return self
 
-    async def __aexit__(self) -> None:
+    async def __aexit__(self, *_: object) -> None:
         if self._authn_sess:
-            await self._authn_sess.__aexit__(None, None, None)
+            await self._authn_sess.close()
 
-    @exception_handler
     @login_required
     async def update_or_create_kvv1_secret(
         self, **payload: Unpack[dto.KvV1SecretCreateDTO]
     ) -> None:
         return await self._kvv1_mgr.update_or_create(**payload)
 
-    @exception_handler
     @login_required
     async def update_or_create_kvv2_secret(
         self, **payload: Unpack[dto.KvV2SecretCreateDTO]
@@ -156,7 +168,6 @@ class Client:
         """
         return await self._kvv2_mgr.update_or_create(**payload)
 
-    @exception_handler
     @login_required
     async def read_kvv1_secret(
         self, **payload: Unpack[dto.SecretReadDTO]
@@ -173,7 +184,6 @@ class Client:
         self, path: str, policy: PasswordPolicy
     ) -> None: ...
 
-    @exception_handler
     @login_required
     async def update_or_create_password_policy(
         self, path: str, policy: PasswordPolicy | str
@@ -192,13 +202,12 @@ class Client:
         await self._pwd_policy_mgr.update_or_create(
             path=path,
             policy=(
-                await self._render_password_policy(policy=policy)
+                await _render_password_policy(policy=policy)
                 if isinstance(policy, dict)
                 else policy
             ),
         )
 
-    @exception_handler
     @login_required
     async def read_password_policy(self, path: str) -> PasswordPolicy | None:
         """
@@ -221,7 +230,6 @@ class Client:
             else None
         )
 
-    @exception_handler
     @login_required
     async def generate_password(self, policy_ref: str) -> str:
         """
@@ -232,54 +240,46 @@ class Client:
         """
         return await self._pwd_policy_mgr.generate_password(policy_ref=policy_ref)
 
-    @exception_handler
     @login_required
     async def generate_root(
         self, **payload: Unpack[dto.IssuerGenerateRootDTO]
     ) -> pki.GenerateRootResult:
         return await self._pki_mgr.generate_root(**payload)
 
-    @exception_handler
     @login_required
     async def generate_intermediate_csr(
         self, **payload: Unpack[dto.IssuerGenerateIntmdCSRDTO]
     ) -> pki.GenerateIntmdCSRResult:
         return await self._pki_mgr.generate_intmd_csr(**payload)
 
-    @exception_handler
     @login_required
     async def sign_intermediate(
         self, **payload: Unpack[dto.IssuerSignIntmdDTO]
     ) -> pki.SignIntmdResult:
         return await self._pki_mgr.sign_intmd(**payload)
 
-    @exception_handler
     @login_required
     async def set_signed_intermediate(
         self, **payload: Unpack[dto.IssuerSetSignedIntmdDTO]
     ) -> pki.SetSignedIntmdResult:
         return await self._pki_mgr.set_signed_intmd(**payload)
 
-    @exception_handler
     @login_required
     async def update_pki_key(self, **payload: Unpack[dto.KeyUpdateDTO]) -> None:
         return await self._pki_mgr.update_key(**payload)
 
-    @exception_handler
     @login_required
     async def update_issuer(
         self, **payload: Unpack[dto.IssuerUpdateDTO]
     ) -> pki.IssuerUpdateResult:
         return await self._pki_mgr.update_issuer(**payload)
 
-    @exception_handler
     @login_required
     async def read_issuer(
         self, **payload: Unpack[dto.IssuerReadDTO]
     ) -> pki.IssuerReadResult | None:
         return await self._pki_mgr.read_issuer(**payload)
 
-    @exception_handler
     @login_required
     async def update_or_create_pki_role(
         self, **payload: Unpack[dto.PKIRoleCreateDTO]
@@ -292,49 +292,42 @@ class Client:
     ) -> pki.RoleReadResult | None:
         return await self._pki_mgr.read_role(**payload)
 
-    @exception_handler
     @login_required
     async def enable_secrets_engine(
         self, **payload: Unpack[dto.SecretsEngineEnableDTO]
     ) -> None:
         return await self._sb_mgr.enable_secrets_engine(**payload)
 
-    @exception_handler
     @login_required
     async def configure_secrets_engine(
         self, **payload: Unpack[dto.SecretsEngineConfigureDTO]
     ) -> None:
         return await self._kvv2_mgr.configure_secret_engine(**payload)
 
-    @exception_handler
     @login_required
     async def tune_mount_configuration(
         self, **payload: Unpack[dto.SecretsEngineTuneMountConfigurationDTO]
     ) -> None:
         return await self._sb_mgr.tune_mount_configuration(**payload)
 
-    @exception_handler
     @login_required
     async def read_mount_configuration(
         self, **payload: Unpack[dto.SecretsEngineReadDTO]
     ) -> system_backend.ReadMountConfigurationResult | None:
         return await self._sb_mgr.read_mount_configuration(**payload)
 
-    @exception_handler
     @login_required
     async def read_kv_configuration(
         self, **payload: Unpack[dto.SecretsEngineReadDTO]
     ) -> kvv2.ReadConfigurationResult | None:
         return await self._kvv2_mgr.read_configuration(**payload)
 
-    @exception_handler
     @login_required
     async def read_kv_metadata(
         self, **payload: Unpack[dto.SecretReadDTO]
     ) -> kvv2.ReadMetadataResult:
         return await self._kvv2_mgr.read_metadata(**payload)
 
-    @exception_handler
     @login_required
     async def update_or_create_metadata(
         self, **payload: Unpack[dto.SecretUpdateOrCreateMetadata]
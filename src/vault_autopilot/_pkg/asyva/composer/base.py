@@ -2,10 +2,30 @@ from dataclasses import dataclass
 from typing import Any, Iterable
 
 import aiohttp
+from aiohttp.typedefs import JSONDecoder
+from typing_extensions import override
+
+from ..util import json
 
 HeadersContainer = dict[str, str]
 
 
+class Response(aiohttp.ClientResponse):
+    """A client response that decodes JSON with orjson, when it's installed."""
+
+    @override
+    async def json(
+        self,
+        *,
+        encoding: str | None = None,
+        loads: JSONDecoder = json.loads,
+        content_type: str | None = "application/json",
+    ) -> Any:
+        return await super().json(
+            encoding=encoding, loads=loads, content_type=content_type
+        )
+
+
 @dataclass
 class BaseComposer:
     """
@@ -48,5 +68,7 @@ class BaseComposer:
             base_url=self.base_url,
             headers=self.compose_default_headers() | headers,
             skip_auto_headers=self.skip_auto_headers,
+            json_serialize=json.dumps,
+            response_class=Response,
             **kwargs,
         )
@@ -1,6 +1,6 @@
 from collections.abc import Iterable
-from dataclasses import dataclass
-from typing import NotRequired
+from dataclasses import dataclass, field
+from typing import Any, NotRequired
 
 import aiohttp
 from typing_extensions import TypedDict, override
@@ -25,6 +25,17 @@ class AsyvaError(Exception):
         return self.format_message()
 
 
+@dataclass(slots=True)
+class NotAuthenticatedError(AsyvaError):
+    """
+    Raised when calling a method that requires a login on a client that hasn't been
+    authenticated yet.
+    """
+
+    message: str = "The Vault client must be authenticated before calling this method"
+    ctx: AsyvaError.Context = field(default_factory=AsyvaError.Context)
+
+
 @dataclass(slots=True)
 class VaultAPIError(AsyvaError):
     class Context(TypedDict):
@@ -44,6 +55,16 @@ class VaultAPIError(AsyvaError):
     async def from_response(
         cls, message: str, response: aiohttp.ClientResponse
     ) -> "VaultAPIError":
+        return cls.from_body(message, response, await response.json())
+
+    @classmethod
+    def from_body(
+        cls, message: str, response: aiohttp.ClientResponse, body: Any
+    ) -> "VaultAPIError":
+        """
+        Same as :meth:`from_response`, for callers that have already decoded the
+        response body.
+        """
         _STATUS_EXCEPTION_MAP: dict[int, type[VaultAPIError]] = {
             400: InvalidRequestError,
             401: UnauthorizedError,
@@ -57,7 +78,12 @@ class VaultAPIError(AsyvaError):
         }
 
         return _STATUS_EXCEPTION_MAP.get(response.status, UnexpectedError)(
-            message=message, ctx=await cls.compose_context(response)
+            message=message,
+            ctx=cls.Context(
+                response=(body or {}),
+                http_method=response.method,
+                request_url=str(response.url),
+            ),
         )
 
 
@@ -0,0 +1,31 @@
+"""
+JSON encoding and decoding for the client sessions.
+
+orjson is used when it's installed, as it's noticeably faster than the standard
+library on the response payloads. Otherwise, the functions fall back to :mod:`json`.
+"""
+
+import json
+from typing import Any
+
+__all__ = ("dumps", "loads")
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any) -> str:
+    if orjson is None:
+        return json.dumps(obj)
+
+    # Unlike the standard library, orjson rejects non-string keys by default
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def loads(s: str | bytes) -> Any:
+    if orjson is None:
+        return json.loads(s)
+
+    return orjson.loads(s)
@@ -5,7 +5,6 @@ from typing import Any, Callable, Generic, TypeVar
 
 from .. import dto
 from ..exc import UnresolvedDependencyError
-from ..util.coro import BoundlessSemaphore, create_task_limited
 
 T = TypeVar("T")
 
@@ -13,15 +12,9 @@ FilterType = Sequence[type[T]]
 CallbackType = Callable[[Any], Coroutine[Any, Any, Any]]
 
 
-@dataclass(slots=True)
-class HandlerObject(Generic[T]):
-    filter: FilterType[T]
-    callback: CallbackType
-
-
 @dataclass(slots=True)
 class EventObserver(Generic[T]):
-    _handlers: list[HandlerObject[T]] = field(init=False, default_factory=list)
+    _routes: dict[type[T], list[CallbackType]] = field(init=False, default_factory=dict)
 
     def register(self, filter_: FilterType[T], callback: CallbackType) -> None:
         """
@@ -33,14 +26,18 @@ class EventObserver(Generic[T]):
                 handler to be called.
             callback: The function to call when an event matches the filter.
         """
-        self._handlers.append(HandlerObject(filter_, callback))
+        for type_ in filter_:
+            self._routes.setdefault(type_, []).append(callback)
 
     async def trigger(self, event: T) -> None:
+        # The handlers are routed by the exact type of the event, so triggering an event
+        # doesn't depend on the number of handlers registered for other types
+        if not (callbacks := self._routes.get(type(event))):
+            return
+
         async with asyncio.TaskGroup() as tg:
-            for handler in filter(lambda h: type(event) in h.filter, self._handlers):
-                await create_task_limited(
-                    tg, BoundlessSemaphore(), handler.callback(event)
-                )
+            for callback in callbacks:
+                tg.create_task(callback(event))
 
 
 @dataclass(slots=True)
@@ -1,7 +1,9 @@
 import asyncio
+import json
 import logging
 import pathlib
-from collections.abc import Generator, Iterator
+from collections.abc import Iterator
+from contextlib import suppress
 from dataclasses import dataclass
 from typing import IO, Any, Generic, TypeVar
 
@@ -19,7 +21,25 @@ __all__ = ("ManifestParser",)
 T = TypeVar("T", bound="AbstractManifestObject")  # type: ignore
 
 logger = logging.getLogger(__name__)
-loader = yaml.YAML(typ="rt")
+loader = yaml.YAML(typ="safe", pure=False)
+
+
+def _is_json_compatible(value: Any) -> bool:
+    """
+    Returns whether the value survives a round-trip through JSON unchanged. JSON
+    silently converts the non-string mapping keys to strings, the other values it
+    can't represent are rejected by the encoder.
+    """
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _is_json_compatible(item)
+            for key, item in value.items()
+        )
+
+    if isinstance(value, list):
+        return all(_is_json_compatible(item) for item in value)
+
+    return True
 
 
 class AbstractManifestObject(RootModel[T]):
@@ -35,13 +55,20 @@ class ManifestParser(Generic[T]):
 
     This class provides a generic implementation for parsing manifest files and
     converting them into specific object types. It utilizes an iterator to process
-    multiple manifest files and a queue to manage the parsed objects.
+    multiple manifest files and a queue to manage the parsed objects. Files with the
+    ``.json`` extension skip the YAML loader, as pydantic decodes JSON natively.
 
     Attributes:
-        manifest_iterator: An iterator yielding open file objects containing the
-            manifest data in bytes.
+        manifest_iterator: An iterator yielding open (possibly memory-mapped) file
+            objects containing the manifest data in bytes. It's advanced in a worker
+            thread, one file ahead of the parser. The files are closed once parsed.
         object_builder: The class type of the desired output objects.
         queue: A queue to store the parsed objects.
+        use_cache: If ``True``, the decoded YAML documents are cached on disk, keyed
+            by the file content, so that unchanged files skip the YAML loader. The
+            cache holds the manifests in plain text, including any secret values
+            they contain. Unused entries are evicted after parsing, see
+            :func:`util.cache.prune`.
 
     Raises:
         ManifestSyntaxError: Raised when there is a syntax error in the manifest file.
@@ -70,44 +97,122 @@ class ManifestParser(Generic[T]):
         print(await parser.queue.get())
     """
 
-    manifest_iterator: Iterator[IO[bytes]]
+    manifest_iterator: Iterator[IO[bytes] | util.fs.MappedFile]
     object_builder: type[T]
     queue: asyncio.Queue[T | None]
+    use_cache: bool = False
 
     async def execute(self) -> asyncio.Queue[T | None]:
         logger.debug("parsing files")
 
-        def stream_documents(buf: IO[bytes]) -> Generator[Any, Any, Any]:
-            return (obj for obj in loader.load_all(buf))
+        def open_next() -> "asyncio.Future[IO[bytes] | util.fs.MappedFile | None]":
+            # Globbing and opening files are blocking calls, they're run in a worker
+            # thread, so that the next file is opened while the current one is parsed
+            return asyncio.ensure_future(
+                asyncio.to_thread(next, self.manifest_iterator, None)
+            )
 
-        for buf in self.manifest_iterator:
-            iter_, fn = stream_documents(buf), buf.name
+        pending = open_next()
 
-            while True:
-                try:
-                    payload = next(iter_)
-                except YAMLError as ex:
-                    raise ManifestSyntaxError(
-                        str(ex),
-                        ManifestSyntaxError.Context(loc={"filename": pathlib.Path(fn)}),
-                    ) from ex
-                except StopIteration:
-                    break
+        try:
+            while (buf := await pending) is not None:
+                pending = open_next()
 
                 try:
-                    payload = self.object_builder.model_validate(payload)
-                except ValidationError as ex:
-                    raise ManifestValidationError(
-                        str(util.model.convert_errors(ex)),
-                        ManifestValidationError.Context(
-                            loc={"filename": pathlib.Path(fn)}
-                        ),
-                    )
-
-                logger.debug("parsed %r", payload)
-                await self.queue.put(payload)
+                    await self._parse(buf)
+                finally:
+                    buf.close()
+        finally:
+            pending.cancel()
 
         logger.debug("parsed files successfully")
         await self.queue.put(None)
 
+        if self.use_cache:
+            await asyncio.to_thread(util.cache.prune)
+
         return self.queue
+
+    async def _parse(self, buf: IO[bytes] | util.fs.MappedFile) -> None:
+        if buf.name.endswith(".json"):
+            return await self._parse_json(buf)
+
+        fn, cache_key, documents = buf.name, None, None
+        source: bytes | IO[bytes] | util.fs.MappedFile = buf
+
+        if self.use_cache:
+            # The decoded documents are cached as JSON, so subsequent runs with the
+            # same content skip the YAML parser. They're still validated on every run.
+            if isinstance(buf, util.fs.MappedFile):
+                # Large files are hashed in place, the loader reads them from the
+                # mapping as well
+                with buf.getbuffer() as view:
+                    cache_key = util.cache.build_key("manifest", view)
+            else:
+                source = buf.read()
+                cache_key = util.cache.build_key("manifest", source)
+
+            if (cached := util.cache.read(cache_key)) is not None:
+                # A corrupted entry is treated as a miss, and overwritten below
+                with suppress(ValueError):
+                    documents, cache_key = json.loads(cached), None
+
+        if documents is None:
+            # Decoding is CPU-bound, it's run in a worker thread, so that the event
+            # loop keeps serving the requests to Vault in the meantime
+            documents = await asyncio.to_thread(self._load_all, source, fn)
+
+        for payload in documents:
+            await self._put(payload, fn)
+
+        # Only valid manifests are cached. The documents that JSON can't represent
+        # as-is (e.g. containing dates or non-string keys) are parsed on every run.
+        if cache_key is not None and _is_json_compatible(documents):
+            with suppress(TypeError, ValueError):
+                util.cache.write(cache_key, json.dumps(documents).encode())
+
+    @staticmethod
+    def _load_all(source: bytes | IO[bytes] | util.fs.MappedFile, fn: str) -> list[Any]:
+        try:
+            return list(loader.load_all(source))
+        except YAMLError as ex:
+            raise ManifestSyntaxError(
+                str(ex),
+                ManifestSyntaxError.Context(loc={"filename": pathlib.Path(fn)}),
+            ) from ex
+
+    async def _put(self, payload: Any, fn: str) -> None:
+        try:
+            payload = self.object_builder.model_validate(payload)
+        except ValidationError as ex:
+            raise ManifestValidationError(
+                str(util.model.convert_errors(ex)),
+                ManifestValidationError.Context(loc={"filename": pathlib.Path(fn)}),
+            )
+
+        logger.debug("parsed %r", payload)
+        await self.queue.put(payload)
+
+    async def _parse_json(self, buf: IO[bytes] | util.fs.MappedFile) -> None:
+        # JSON is a subset of YAML, but pydantic decodes it natively, without
+        # building an intermediate Python object
+        fn = buf.name
+
+        try:
+            payload = self.object_builder.model_validate_json(buf.read())
+        except ValidationError as ex:
+            if err := next(
+                (err for err in ex.errors() if err["type"] == "json_invalid"), None
+            ):
+                raise ManifestSyntaxError(
+                    err["msg"],
+                    ManifestSyntaxError.Context(loc={"filename": pathlib.Path(fn)}),
+                ) from ex
+
+            raise ManifestValidationError(
+                str(util.model.convert_errors(ex)),
+                ManifestValidationError.Context(loc={"filename": pathlib.Path(fn)}),
+            )
+
+        logger.debug("parsed %r", payload)
+        await self.queue.put(payload)
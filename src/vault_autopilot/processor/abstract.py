@@ -143,24 +143,25 @@ class ChainBasedProcessor(AbstractProcessor[P], Generic[T, P]):
         Returns:
             None
         """
-        if upstream_fbs := await self._build_fallback_upstream_nodes(node):
-            async with self.dep_chain.lock() as mgr:
-                mgr.add_node(node)
+        upstream_fbs = await self._build_fallback_upstream_nodes(node)
 
-                for upstream in upstream_fbs:
-                    if not mgr.has_node(upstream):
-                        logger.debug(
-                            "[%s] add node %r", self.__class__.__name__, upstream
-                        )
-                        mgr.add_node(upstream)
+        # Only the chain is mutated under the lock, the node is flushed once it's
+        # released. The node is claimed before that, otherwise an upstream trigger
+        # could flush it concurrently.
+        async with self.dep_chain.lock() as mgr:
+            mgr.add_node(node)
+
+            for upstream in upstream_fbs:
+                if not mgr.has_node(upstream):
+                    logger.debug("[%s] add node %r", self.__class__.__name__, upstream)
+                    mgr.add_node(upstream)
 
-                    mgr.add_edge(upstream, node)
+                mgr.add_edge(upstream, node)
 
             if not mgr.are_upstreams_satisfied(node):
                 return
-        else:
-            async with self.dep_chain.lock() as mgr:
-                _ = mgr.add_node(node)
+
+            mgr.set_node_status(node, "in_progress")
 
         await self.flush_nodes((node,))
 
@@ -187,7 +188,8 @@ class ChainBasedProcessor(AbstractProcessor[P], Generic[T, P]):
                 downstream_bunch := tuple(
                     mgr.filter_downstreams(
                         node,
-                        function=lambda nbr: mgr.get_node_status(nbr) == "pending"
+                        function=lambda nbr: self.downstream_selector(nbr)
+                        and mgr.get_node_status(nbr) == "pending"
                         and mgr.are_upstreams_satisfied(nbr),
                     )
                 )
@@ -220,8 +222,14 @@ class ChainBasedProcessor(AbstractProcessor[P], Generic[T, P]):
                 )
 
     async def _on_shutdown_requested(self, _: P) -> None:
+        # The chain may be shared with other processors, each of them reports the
+        # edges leading to its own nodes only
         async with self.dep_chain.lock() as mgr:
-            unresolved_deps = tuple(mgr.get_pending_edges())
+            unresolved_deps = tuple(
+                edge
+                for edge in mgr.get_pending_edges()
+                if self.downstream_selector(edge[1])
+            )
 
         from ..dispatcher.event import UnresolvedDepsDetected
 
@@ -23,6 +23,8 @@ class KvV2SecretStorage(UserDict):
     snapshots_secret_path: str
     client: AsyvaClient
     data: dict[Any, Any] = field(init=False, default_factory=dict)
+    is_modified: bool = field(init=False, default=False)
+    """Whether the snapshots have changed since they were pulled."""
 
     async def initialize(self) -> None:
         try:
@@ -65,10 +67,22 @@ class KvV2SecretStorage(UserDict):
             else {}
         )
 
+    def __setitem__(self, key: Any, item: Any) -> None:
+        if self.data.get(key) != item:
+            self.data[key] = item
+            self.is_modified = True
+
+    def __delitem__(self, key: Any) -> None:
+        del self.data[key]
+        self.is_modified = True
+
     async def push(self) -> None:
-        if self.data:
+        # Snapshots are only written when a resource was created, runs that merely
+        # verify the resources don't need a round-trip
+        if self.is_modified and self.data:
             await self.client.update_or_create_kvv1_secret(
                 mount_path=self.secrets_engine_path,
                 path=self.snapshots_secret_path,
                 data=self.data,
             )
+            self.is_modified = False
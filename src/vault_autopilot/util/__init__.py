@@ -1,3 +1,3 @@
-from . import coro, dependency_chain, encoding, model
+from . import cache, coro, dependency_chain, encoding, fs, model
 
-__all__ = ("encoding", "coro", "model", "dependency_chain")
+__all__ = ("cache", "encoding", "coro", "model", "dependency_chain", "fs")
@@ -0,0 +1,94 @@
+import hashlib
+import os
+import pathlib
+import tempfile
+import time
+from contextlib import suppress
+
+from .. import __version__
+
+__all__ = ("build_key", "read", "write", "prune")
+
+CACHE_DIR = (
+    pathlib.Path(os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache")
+    / "vault-autopilot"
+)
+MAX_AGE = 30 * 24 * 60 * 60
+"""Entries that haven't been used for longer than this (in seconds) are evicted by
+:func:`prune`."""
+MAX_SIZE = 64 * 1024 * 1024
+"""The total size (in bytes) of the entries kept by :func:`prune`, the least recently
+used entries are evicted first."""
+
+
+def build_key(namespace: str, content: bytes | memoryview) -> str:
+    """
+    Builds a cache key for the given content. The key includes the application
+    version, so entries written by other versions are never picked up.
+    """
+    return "%s-%s-%s" % (
+        namespace,
+        __version__,
+        hashlib.blake2b(content, digest_size=16).hexdigest(),
+    )
+
+
+def read(key: str) -> bytes | None:
+    """Returns the cached value for the given key, or ``None`` on a cache miss."""
+    fn = CACHE_DIR / key
+
+    try:
+        value = fn.read_bytes()
+    except OSError:
+        return None
+
+    # The modification time tracks the last use of the entry, see prune()
+    with suppress(OSError):
+        os.utime(fn)
+
+    return value
+
+
+def write(key: str, value: bytes) -> None:
+    """
+    Atomically stores the value under the given key.
+
+    Cached values may contain secrets, therefore the cache files are readable by the
+    owner only. Failing to write the cache is not an error, the value is simply
+    recomputed on the next run.
+    """
+    with suppress(OSError):
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        # mkstemp creates the file with 0600 permissions
+        fd, tmp_fn = tempfile.mkstemp(dir=CACHE_DIR)
+        try:
+            with os.fdopen(fd, "wb") as buf:
+                buf.write(value)
+            os.replace(tmp_fn, CACHE_DIR / key)
+        except OSError:
+            os.unlink(tmp_fn)
+            raise
+
+
+def prune(max_age: float = MAX_AGE, max_size: int = MAX_SIZE) -> None:
+    """
+    Evicts the entries that haven't been used for more than ``max_age`` seconds, then
+    the least recently used ones until the remaining entries fit in ``max_size``
+    bytes. Entries written by other versions of the application are never used, and
+    therefore expire as well.
+    """
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            entries = [(entry.path, entry.stat()) for entry in it if entry.is_file()]
+    except OSError:
+        return
+
+    expires_at, size = time.time() - max_age, 0
+
+    for fn, stat in sorted(entries, key=lambda item: item[1].st_mtime, reverse=True):
+        size += stat.st_size
+
+        if stat.st_mtime < expires_at or size > max_size:
+            with suppress(OSError):
+                os.unlink(fn)
@@ -0,0 +1,207 @@
+import fnmatch
+import mmap
+import os
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import IO
+
+__all__ = ("iglob_files", "open_binary", "MappedFile")
+
+RECURSIVE_WILDCARD = "**"
+MMAP_THRESHOLD = 16 * 1024
+"""Files larger than this size (in bytes) are memory-mapped by :func:`open_binary`,
+smaller ones are cheaper to read through a regular buffered file object."""
+
+_magic_check = re.compile("[*?[]")
+
+
+@dataclass(frozen=True, slots=True)
+class _Wildcard:
+    regex: re.Pattern[str]
+    match_hidden: bool
+
+    @classmethod
+    def compile(cls, pattern: str) -> "_Wildcard":
+        return cls(re.compile(fnmatch.translate(pattern)), pattern.startswith("."))
+
+    def match(self, name: str) -> bool:
+        if name.startswith(".") and not self.match_hidden:
+            return False
+        return self.regex.match(name) is not None
+
+
+# A literal path component, a compiled wildcard, or ``RECURSIVE_WILDCARD``. Literal
+# components never contain magic characters, so they can't be confused with the
+# latter.
+Segment = str | _Wildcard
+
+
+def _scandir(path: str) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(path or os.curdir) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _is_dir(entry: os.DirEntry[str]) -> bool:
+    # Like glob, an entry that can't be inspected (e.g. a symlink loop) is treated as
+    # a regular file
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _iter_dirs_recursively(path: str) -> Iterator[str]:
+    """Yields the given directory followed by all of its non-hidden subdirectories."""
+    yield path
+
+    for entry in _scandir(path):
+        if not entry.name.startswith(".") and _is_dir(entry):
+            yield from _iter_dirs_recursively(os.path.join(path, entry.name))
+
+
+def _iter_files_recursively(path: str) -> Iterator[str]:
+    """
+    Yields all the non-hidden files below the given directory. The files are yielded
+    as they're found, in the same order as :func:`glob.iglob`.
+    """
+    for entry in _scandir(path):
+        if entry.name.startswith("."):
+            continue
+
+        if _is_dir(entry):
+            yield from _iter_files_recursively(os.path.join(path, entry.name))
+        else:
+            yield os.path.join(path, entry.name)
+
+
+def _iter_files(path: str, match: _Wildcard | None = None) -> Iterator[str]:
+    for entry in _scandir(path):
+        if (match.match(entry.name) if match else not entry.name.startswith(".")) and (
+            not _is_dir(entry)
+        ):
+            yield os.path.join(path, entry.name)
+
+
+def _walk(path: str, segments: tuple[Segment, ...]) -> Iterator[str]:
+    segment, rest = segments[0], segments[1:]
+
+    if segment == RECURSIVE_WILDCARD and not rest:
+        yield from _iter_files_recursively(path)
+    elif segment == RECURSIVE_WILDCARD:
+        for dirname in _iter_dirs_recursively(path):
+            yield from _walk(dirname, rest)
+    elif isinstance(segment, str):
+        path = os.path.join(path, segment)
+
+        if rest:
+            yield from _walk(path, rest)
+        elif os.path.lexists(path) and not os.path.isdir(path):
+            yield path
+    elif rest:
+        for entry in _scandir(path):
+            if segment.match(entry.name) and _is_dir(entry):
+                yield from _walk(os.path.join(path, entry.name), rest)
+    else:
+        yield from _iter_files(path, segment)
+
+
+def iglob_files(pathname: str, recursive: bool = False) -> Iterator[str]:
+    """
+    Returns an iterator which yields the paths of the files matching a pathname
+    pattern.
+
+    Behaves like :func:`glob.iglob`, except that directories are left out of the
+    result. Directory entries are read with :func:`os.scandir`, so telling a file from
+    a directory doesn't require an extra ``stat`` call per match.
+
+    Args:
+        pathname: A simple filename or a Unix shell-style pattern.
+        recursive: If ``True``, the pattern ``**`` matches any files and zero or more
+            directories and subdirectories.
+    """
+    drive, pathname = os.path.splitdrive(pathname)
+
+    # A trailing separator matches directories only
+    if not pathname or pathname.endswith(os.sep):
+        return
+
+    # A literal pathname matches at most one file, there's nothing to traverse
+    if not _magic_check.search(pathname):
+        pathname = drive + pathname
+        if os.path.lexists(pathname) and not os.path.isdir(pathname):
+            yield pathname
+        return
+
+    root, parts = drive, pathname.split(os.sep)
+    if not parts[0]:
+        root += os.sep
+
+    yield from _walk(
+        root,
+        tuple(
+            part
+            if recursive and part == RECURSIVE_WILDCARD
+            else (_Wildcard.compile(part) if _magic_check.search(part) else part)
+            for part in parts
+            if part
+        ),
+    )
+
+
+@dataclass(slots=True)
+class MappedFile:
+    """
+    A read-only, memory-mapped file that exposes the subset of the binary file object
+    interface consumed by the manifest parser.
+    """
+
+    name: str
+    _map: mmap.mmap
+
+    def read(self, size: int = -1) -> bytes:
+        return self._map.read(size)
+
+    def getbuffer(self) -> memoryview:
+        """
+        Returns a read-only view over the whole content, without copying it. The view
+        must be released before the file is closed.
+        """
+        return memoryview(self._map)
+
+    def close(self) -> None:
+        self._map.close()
+
+
+def open_binary(fn: str) -> IO[bytes] | MappedFile:
+    """
+    Opens a file for reading in binary mode.
+
+    Files larger than :data:`MMAP_THRESHOLD` are memory-mapped, letting the reader
+    consume the page cache directly instead of copying the content through an
+    intermediate buffer. Smaller files fit in the read buffer, and are therefore read
+    with a single system call.
+
+    The content is fetched ahead of time, as the function is called from a worker
+    thread, so that the parser, which runs in the event loop, doesn't wait for disk
+    I/O.
+    """
+    buf = open(fn, "rb", buffering=MMAP_THRESHOLD)
+
+    if os.fstat(buf.fileno()).st_size <= MMAP_THRESHOLD:
+        buf.peek()
+        return buf
+
+    # The mapping holds its own reference to the file, the descriptor can be closed
+    with buf:
+        map_ = mmap.mmap(buf.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # Lets the kernel read the pages in the background, instead of faulting them in
+    # one by one as the parser goes
+    if hasattr(mmap, "MADV_WILLNEED"):
+        map_.madvise(mmap.MADV_WILLNEED)
+
+    return MappedFile(fn, map_)
@@ -0,0 +1,44 @@
+from typing import Any
+
+import pytest
+from pydantic import SecretStr
+
+from vault_autopilot._conf import KubernetesAuthMethod, Settings, TokenAuthMethod
+
+
+@pytest.mark.parametrize(
+    "auth",
+    [
+        TokenAuthMethod(token="s3cr3t", method="token"),  # type: ignore[arg-type]
+        KubernetesAuthMethod(
+            mount_path="kubernetes",
+            role="role",
+            jwt="s3cr3t",  # type: ignore[arg-type]
+            method="kubernetes",
+        ),
+    ],
+)
+def test_auth_method_built_directly_masks_secret(auth: Any) -> None:
+    secret = auth.token if isinstance(auth, TokenAuthMethod) else auth.jwt
+
+    assert isinstance(secret, SecretStr)
+    assert secret.get_secret_value() == "s3cr3t"
+    assert "s3cr3t" not in repr(auth)
+
+
+@pytest.mark.parametrize(
+    "auth",
+    [
+        {"method": "token", "token": "s3cr3t"},
+        {"method": "kubernetes", "mountPath": "k", "role": "r", "jwt": "s3cr3t"},
+    ],
+)
+def test_auth_method_validated_by_settings_masks_secret(auth: Any) -> None:
+    settings = Settings(
+        baseUrl="http://localhost:8200",  # type: ignore[call-arg]
+        storage={"type": "kvv1-secret"},  # type: ignore[typeddict-item]
+        auth=auth,
+    )
+
+    assert "s3cr3t" not in repr(settings)
+    assert "s3cr3t" not in repr(settings.auth)
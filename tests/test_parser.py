@@ -0,0 +1,107 @@
+import asyncio
+import io
+import os
+import pathlib
+from typing import Any, TypeVar
+
+import pytest
+
+from vault_autopilot._cli.commands.apply import ManifestObject
+from vault_autopilot.parser import AbstractManifestObject, ManifestParser
+from vault_autopilot.util import cache
+
+T = TypeVar("T", bound=AbstractManifestObject)  # type: ignore
+
+MANIFESTS = b"""\
+kind: SecretsEngine
+spec:
+  path: kv
+  engine:
+    type: kv-v2
+---
+kind: PasswordPolicy
+spec:
+  path: pol
+  policy:
+    length: 10
+    rules:
+      - charset: abc
+        minChars: 1
+---
+kind: Password
+spec:
+  secretsEngineRef: kv
+  path: pw
+  version: 1
+  secretKey: k
+  policyRef: pol
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    path = tmp_path / "cache"
+    monkeypatch.setattr(cache, "CACHE_DIR", path)
+    return path
+
+
+def parse(content: bytes, object_builder: type[T], use_cache: bool = True) -> list[T]:
+    buf = io.BytesIO(content)
+    buf.name = "manifest.yaml"
+
+    async def run() -> list[T]:
+        queue = await ManifestParser[T](
+            manifest_iterator=iter([buf]),  # type: ignore[list-item]
+            object_builder=object_builder,
+            queue=asyncio.Queue(),
+            use_cache=use_cache,
+        ).execute()
+
+        result = []
+        while (obj := queue.get_nowait()) is not None:
+            result.append(obj)
+        return result
+
+    return asyncio.run(run())
+
+
+def test_cache_hit_matches_miss(cache_dir: pathlib.Path) -> None:
+    miss = parse(MANIFESTS, ManifestObject)
+    assert len(os.listdir(cache_dir)) == 1
+
+    hit = parse(MANIFESTS, ManifestObject)
+
+    assert hit == miss == parse(MANIFESTS, ManifestObject, use_cache=False)
+    assert len(miss) == 3
+
+
+def test_cache_disabled(cache_dir: pathlib.Path) -> None:
+    parse(MANIFESTS, ManifestObject, use_cache=False)
+
+    assert not cache_dir.exists()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b"kind: Password\nspec: {1: one, '1': two}\n",
+        b"kind: Password\nspec: {createdAt: 2024-01-01}\n",
+    ],
+)
+def test_lossy_documents_are_not_cached(
+    content: bytes, cache_dir: pathlib.Path
+) -> None:
+    miss: list[Any] = parse(content, AbstractManifestObject)
+    hit: list[Any] = parse(content, AbstractManifestObject)
+
+    assert hit == miss
+    assert not cache_dir.exists() or not os.listdir(cache_dir)
+
+
+def test_corrupted_entry_is_parsed_again(cache_dir: pathlib.Path) -> None:
+    expected = parse(MANIFESTS, ManifestObject)
+    (entry,) = cache_dir.iterdir()
+    entry.write_bytes(entry.read_bytes()[:10])
+
+    assert parse(MANIFESTS, ManifestObject) == expected
+    assert parse(MANIFESTS, ManifestObject) == expected
@@ -0,0 +1,73 @@
+import os
+import pathlib
+import time
+
+import pytest
+
+from vault_autopilot import __version__
+from vault_autopilot.util import cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    path = tmp_path / "cache"
+    monkeypatch.setattr(cache, "CACHE_DIR", path)
+    return path
+
+
+def test_build_key() -> None:
+    key = cache.build_key("manifest", b"kind: Password\n")
+
+    assert key.startswith("manifest-%s-" % __version__)
+    assert key == cache.build_key("manifest", memoryview(b"kind: Password\n"))
+    assert key != cache.build_key("manifest", b"kind: Issuer\n")
+    assert key != cache.build_key("settings", b"kind: Password\n")
+
+
+def test_read_miss() -> None:
+    assert cache.read("missing") is None
+
+
+def test_write_read(cache_dir: pathlib.Path) -> None:
+    cache.write("key", b"value")
+
+    assert cache.read("key") == b"value"
+    # Written atomically, no temporary file is left behind
+    assert os.listdir(cache_dir) == ["key"]
+    assert (cache_dir / "key").stat().st_mode & 0o777 == 0o600
+
+
+def test_write_overwrites(cache_dir: pathlib.Path) -> None:
+    cache.write("key", b"old")
+    cache.write("key", b"new")
+
+    assert cache.read("key") == b"new"
+    assert os.listdir(cache_dir) == ["key"]
+
+
+def test_prune_evicts_expired_entries(cache_dir: pathlib.Path) -> None:
+    cache.write("old", b"value")
+    cache.write("new", b"value")
+    expired_at = time.time() - cache.MAX_AGE - 1
+    os.utime(cache_dir / "old", (expired_at, expired_at))
+
+    cache.prune()
+
+    assert os.listdir(cache_dir) == ["new"]
+
+
+def test_prune_evicts_least_recently_used_entries(cache_dir: pathlib.Path) -> None:
+    now = time.time()
+    for age, key in enumerate(("a", "b", "c")):
+        cache.write(key, b"0123456789")
+        os.utime(cache_dir / key, (now - age, now - age))
+
+    # Reading an entry marks it as recently used
+    cache.read("c")
+    cache.prune(max_size=20)
+
+    assert sorted(os.listdir(cache_dir)) == ["a", "c"]
+
+
+def test_prune_without_cache_dir() -> None:
+    cache.prune()
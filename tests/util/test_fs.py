@@ -0,0 +1,109 @@
+import glob
+import os
+import pathlib
+
+import pytest
+
+from vault_autopilot.util.fs import iglob_files
+
+TREE = (
+    "a.yaml",
+    "b.yml",
+    ".hidden.yaml",
+    "x/c.yaml",
+    "x/.d.yaml",
+    "x/y/e.yaml",
+    "x/y/z/f.yaml",
+    "x/y/z/g.json",
+    ".h/i.yaml",
+    "j/k.yaml",
+    "dir.yaml/l.yaml",
+)
+
+PATTERNS = (
+    "a.yaml",
+    "x/c.yaml",
+    "missing.yaml",
+    "x",
+    "x/",
+    "*.yaml",
+    "*",
+    ".*",
+    "*.y*ml",
+    "[ab].y*",
+    "x/*.yaml",
+    "x/.*",
+    "*/*.yaml",
+    "*/y/*",
+    "x/y/z/*.json",
+    "**",
+    "**/*.yaml",
+    "**/*",
+    "x/**",
+    "x/**/*.yaml",
+    "x/**/z/*",
+    "**/z/*",
+    "**/.*",
+    ".h/**",
+    "dir.yaml",
+    "*.yaml/*",
+    "link/**/*.yaml",
+    "broken.yaml",
+)
+
+
+@pytest.fixture
+def tree(tmp_path: pathlib.Path) -> pathlib.Path:
+    for fn in TREE:
+        path = tmp_path / fn
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    (tmp_path / "link").symlink_to("x")
+    (tmp_path / "m.yaml").symlink_to("a.yaml")
+    (tmp_path / "broken.yaml").symlink_to("missing")
+
+    return tmp_path
+
+
+def expected(pattern: str, recursive: bool) -> list[str]:
+    return [
+        fn
+        for fn in glob.iglob(pattern, recursive=recursive)
+        if not pathlib.Path(fn).is_dir()
+    ]
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_iglob_files_matches_glob_relative(
+    pattern: str,
+    recursive: bool,
+    tree: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(tree)
+    pattern = pattern.replace("/", os.sep)
+
+    assert list(iglob_files(pattern, recursive)) == expected(pattern, recursive)
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_iglob_files_matches_glob_absolute(
+    pattern: str, recursive: bool, tree: pathlib.Path
+) -> None:
+    pattern = os.path.join(tree, pattern.replace("/", os.sep))
+
+    assert list(iglob_files(pattern, recursive)) == expected(pattern, recursive)
+
+
+def test_iglob_files_skips_symlink_loop(tmp_path: pathlib.Path) -> None:
+    (tmp_path / "manifest.yaml").touch()
+    (tmp_path / "loop").symlink_to(tmp_path / "loop")
+
+    pattern = os.path.join(tmp_path, "**", "*.yaml")
+
+    assert list(iglob_files(pattern, recursive=True)) == [
+        os.path.join(tmp_path, "manifest.yaml")
+    ]